@@ -2,10 +2,14 @@
 
 from .report import ScentReport
 
-# Import GUI only if tkinter is available
-try:
-    from .gui import DigitalNoseApp
-    __all__ = ["DigitalNoseApp", "ScentReport"]
-except ImportError:
-    # GUI not available in headless environments
-    __all__ = ["ScentReport"]
+__all__ = ["DigitalNoseApp", "ScentReport"]
+
+
+def __getattr__(name: str):
+    # Import the Tk GUI lazily so model/CLI use never pays the tkinter
+    # import cost (and headless environments without tkinter still work).
+    if name == "DigitalNoseApp":
+        from .gui import DigitalNoseApp
+
+        return DigitalNoseApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
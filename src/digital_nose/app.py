@@ -7,22 +7,38 @@ import random
 from pathlib import Path
 from typing import Iterable
 
-from rich.console import Console
-from rich.table import Table
-
 from .dataset import ensure_dataset, load_dataset
 from .model import ModelArtifacts, predict, train_model
 from .report import ScentReport, intensity_from_reading
-from .sensors import ENVIRONMENT_FEATURES, VOC_FEATURES, SensorSimulator, ScentProfile
+from .sensors import (
+    ENVIRONMENT_FEATURES,
+    VOC_FEATURES,
+    SensorSimulator,
+    ScentProfile,
+)
+
+_console = None
+
 
-console = Console()
+def _get_console():
+    # Import rich lazily: importing this module for its helpers should not
+    # pay the rich import cost, only actually printing should.
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def _print_header(title: str) -> None:
-    console.rule(f"[bold green]{title}")
+    _get_console().rule(f"[bold green]{title}")
 
 
 def train_and_evaluate(dataset_path: Path) -> tuple[ModelArtifacts, dict[str, object]]:
+    from rich.table import Table
+
+    console = _get_console()
     df = load_dataset(dataset_path)
     artifacts, metrics = train_model(df)
     console.print("[bold cyan]Model trained.[/]")
@@ -42,9 +58,10 @@ def train_and_evaluate(dataset_path: Path) -> tuple[ModelArtifacts, dict[str, ob
 
 def simulate_live_reading(artifacts: ModelArtifacts, profile: ScentProfile) -> ScentReport:
     simulator = SensorSimulator()
-    reading = simulator.capture(profile, n_samples=1)[0]
-    total_voc = sum(reading[feature] for feature in VOC_FEATURES)
-    env = {feature: reading[feature] for feature in ENVIRONMENT_FEATURES}
+    reading_vec, reading = simulator.capture_vector(profile)
+    n_voc = len(VOC_FEATURES)
+    total_voc = float(reading_vec[:n_voc].sum())
+    env = dict(zip(ENVIRONMENT_FEATURES, reading_vec[n_voc:].tolist()))
     predicted_family, probabilities = predict(artifacts, reading)
     report = ScentReport.from_prediction(
         predicted_family=predicted_family,
@@ -56,6 +73,8 @@ def simulate_live_reading(artifacts: ModelArtifacts, profile: ScentProfile) -> S
 
 
 def display_report(report: ScentReport) -> None:
+    from rich.table import Table
+
     table = Table(title="Scent Report")
     table.add_column("Field", style="bold")
     table.add_column("Value")
@@ -64,7 +83,7 @@ def display_report(report: ScentReport) -> None:
             table.add_row(key, json.dumps(value, indent=2))
         else:
             table.add_row(key, str(value))
-    console.print(table)
+    _get_console().print(table)
 
 
 def main(args: Iterable[str] | None = None) -> None:
@@ -72,6 +91,7 @@ def main(args: Iterable[str] | None = None) -> None:
     _print_header("Digital Nose Sample App")
     artifacts, _ = train_and_evaluate(dataset_path)
 
+    console = _get_console()
     console.print("\n[bold green]Simulating live scent capture...[/]")
     sample_profile = random.choice(list(_available_profiles()))
     report = simulate_live_reading(artifacts, sample_profile)
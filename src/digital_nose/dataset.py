@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Dict
+from typing import Iterable, Dict
+
+import numpy as np
 
 from .sensors import (
+    ALL_FEATURES,
     DEFAULT_PROFILES,
-    ENVIRONMENT_FEATURES,
     SensorSimulator,
     ScentProfile,
-    VOC_FEATURES,
     sample_dataset,
 )
 
-FIELD_ORDER = VOC_FEATURES + ENVIRONMENT_FEATURES + ["scent_family"]
+FIELD_ORDER = ALL_FEATURES + ("scent_family",)
 
-DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+# Pure path arithmetic; resolve() would stat every ancestor directory on
+# each cold import just to normalize symlinks we do not rely on.
+_PKG_DIR = Path(__file__).parent
+DATA_DIR = _PKG_DIR.parent.parent / "data"
 DEFAULT_DATASET_PATH = DATA_DIR / "sample_scent_readings.csv"
 
 
+@dataclass
+class ScentDataset:
+    """Column-oriented dataset: one float matrix plus a label vector.
+
+    Keeping the readings as a single ``(n_rows, n_features)`` array instead of
+    a dict per row halves memory use and lets training consume the data
+    without per-cell ``float()`` conversions.
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+    def row_dict(self, index: int) -> Dict[str, float | str]:
+        """Return one reading in the dict form used by the GUI helpers."""
+
+        entry: Dict[str, float | str] = dict(
+            zip(ALL_FEATURES, self.X[index].tolist())
+        )
+        entry["scent_family"] = str(self.y[index])
+        return entry
+
+
 def ensure_dataset(
     *,
     path: Path = DEFAULT_DATASET_PATH,
@@ -31,42 +61,48 @@ def ensure_dataset(
 
     path.parent.mkdir(parents=True, exist_ok=True)
     if not path.exists() or force:
-        rows = sample_dataset(
+        values, labels = sample_dataset(
             profiles=profiles or DEFAULT_PROFILES,
             samples_per_profile=samples_per_profile,
             simulator=SensorSimulator(),
         )
+
+        # Format the whole table in one vectorized pass and issue a single
+        # write instead of a DictWriter call per row.
+        cells = np.column_stack([np.char.mod("%.6g", values), labels])
+
+        lines = [",".join(FIELD_ORDER)]
+        lines.extend(",".join(row) for row in cells)
         with path.open("w", newline="") as handle:
-            writer = _csv_writer(handle)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow({field: row[field] for field in FIELD_ORDER})
+            handle.write("\n".join(lines) + "\n")
     return path
 
 
-def load_dataset(path: Path = DEFAULT_DATASET_PATH) -> List[Dict[str, float | str]]:
+def load_dataset(path: Path = DEFAULT_DATASET_PATH) -> ScentDataset:
     """Load the dataset, generating it first if necessary."""
 
     ensure_dataset(path=path)
-    dataset: List[Dict[str, float | str]] = []
-    with path.open(newline="") as handle:
-        reader = _csv_reader(handle)
-        for row in reader:
-            entry: Dict[str, float | str] = {}
-            for field in VOC_FEATURES + ENVIRONMENT_FEATURES:
-                entry[field] = float(row[field])
-            entry["scent_family"] = row["scent_family"]
-            dataset.append(entry)
-    return dataset
-
-
-def _csv_writer(handle):
-    import csv
 
-    return csv.DictWriter(handle, fieldnames=FIELD_ORDER)
-
-
-def _csv_reader(handle):
-    import csv
-
-    return csv.DictReader(handle)
+    # Resolve column positions from the header once, then let np.loadtxt's
+    # C parser handle the numeric bulk instead of a per-row DictReader loop.
+    with path.open(newline="") as handle:
+        header = handle.readline().strip().split(",")
+    column_index = {name: position for position, name in enumerate(header)}
+
+    X = np.loadtxt(
+        path,
+        delimiter=",",
+        skiprows=1,
+        usecols=[column_index[field] for field in ALL_FEATURES],
+        dtype=np.float64,
+        ndmin=2,
+    )
+    y = np.loadtxt(
+        path,
+        delimiter=",",
+        skiprows=1,
+        usecols=column_index["scent_family"],
+        dtype=str,
+        ndmin=1,
+    )
+    return ScentDataset(X=X, y=y)
@@ -7,8 +7,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict
 
-from .dataset import load_dataset
-from .model import predict, train_model
+from .dataset import ensure_dataset
+from .model import predict, train_model_cached
 from .report import ScentReport, intensity_from_reading
 from .sensors import (
     ENVIRONMENT_FEATURES,
@@ -16,6 +16,7 @@ from .sensors import (
     DEFAULT_PROFILES,
     SensorSimulator,
     ScentProfile,
+    get_voc_values,
 )
 
 
@@ -33,8 +34,11 @@ class DigitalNoseApp(tk.Tk):
         self.minsize(900, 600)
 
         self.simulator = SensorSimulator()
-        self.dataset = load_dataset()
-        self.artifacts, self.metrics = train_model(self.dataset)
+        dataset_path = ensure_dataset()
+        self.artifacts, self.metrics = train_model_cached(dataset_path)
+        # Warm the predict path (and any compiled kernel cache) before the
+        # first Capture click.
+        predict(self.artifacts, DEFAULT_PROFILES[0].mean_vector)
 
         self.profile_map: Dict[str, ScentProfile] = {
             profile.name: profile for profile in DEFAULT_PROFILES
@@ -112,6 +116,16 @@ class DigitalNoseApp(tk.Tk):
         )
         self.chart_canvas.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
 
+        # Bars and axes are drawn into one persistent off-screen image and
+        # blitted with a single canvas item; per-bar create_rectangle calls
+        # would each round-trip through the Tcl interpreter.
+        self._chart_image = tk.PhotoImage(
+            width=self.CHART_WIDTH, height=self.CHART_HEIGHT
+        )
+        self._chart_item = self.chart_canvas.create_image(
+            0, 0, image=self._chart_image, anchor=tk.NW
+        )
+
         right_panel = ttk.Frame(body)
         right_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -181,9 +195,10 @@ class DigitalNoseApp(tk.Tk):
             self.status_label.config(text="Unknown profile selected.")
             return
 
-        reading = self.simulator.capture(profile, n_samples=1)[0]
-        total_voc = sum(reading[feature] for feature in VOC_FEATURES)
-        environment = {feature: reading[feature] for feature in ENVIRONMENT_FEATURES}
+        reading_vec, reading = self.simulator.capture_vector(profile)
+        n_voc = len(VOC_FEATURES)
+        total_voc = float(reading_vec[:n_voc].sum())
+        environment = dict(zip(ENVIRONMENT_FEATURES, reading_vec[n_voc:].tolist()))
 
         predicted_family, probabilities = predict(self.artifacts, reading)
         report = ScentReport.from_prediction(
@@ -207,9 +222,11 @@ class DigitalNoseApp(tk.Tk):
     # UI update helpers
     # ------------------------------------------------------------------
     def _render_chart(self, reading: Dict[str, float]) -> None:
-        self.chart_canvas.delete("all")
+        image = self._chart_image
+        image.blank()
+        self.chart_canvas.delete("chart-text")
 
-        values = [float(reading[feature]) for feature in VOC_FEATURES]
+        values = [float(value) for value in get_voc_values(reading)]
         max_value = max(itertools.chain(values, [1.0]))
         chart_height = self.CHART_HEIGHT - self.CHART_MARGIN * 2
         chart_width = self.CHART_WIDTH - self.CHART_MARGIN * 2
@@ -217,44 +234,41 @@ class DigitalNoseApp(tk.Tk):
 
         colors = ["#5b8ff9", "#61d9a1", "#65789b", "#f6bd16", "#7262fd", "#78d3f8"]
 
-        for idx, feature in enumerate(VOC_FEATURES):
-            value = float(reading[feature])
+        for idx, (feature, value) in enumerate(zip(VOC_FEATURES, values)):
             height_ratio = value / max_value if max_value else 0
             bar_height = height_ratio * chart_height
-            x0 = self.CHART_MARGIN + idx * bar_width + 10
-            x1 = x0 + bar_width - 20
+            x0 = int(self.CHART_MARGIN + idx * bar_width + 10)
+            x1 = int(x0 + bar_width - 20)
             y1 = self.CHART_HEIGHT - self.CHART_MARGIN
-            y0 = y1 - bar_height
+            y0 = int(y1 - bar_height)
             color = colors[idx % len(colors)]
-            self.chart_canvas.create_rectangle(x0, y0, x1, y1, fill=color, width=0)
+            if x1 > x0 and y1 > y0:
+                image.put(color, to=(x0, y0, x1, y1))
             self.chart_canvas.create_text(
                 (x0 + x1) / 2,
                 y0 - 12,
                 text=f"{value:.0f}",
                 font=("Helvetica", 9),
                 fill="#333333",
+                tags="chart-text",
             )
             self.chart_canvas.create_text(
                 (x0 + x1) / 2,
                 y1 + 14,
                 text=feature.replace("_ppb", "").replace("_", "\n"),
                 font=("Helvetica", 9),
+                tags="chart-text",
             )
 
-        # Axes
-        self.chart_canvas.create_line(
-            self.CHART_MARGIN,
-            self.CHART_HEIGHT - self.CHART_MARGIN,
-            self.CHART_WIDTH - self.CHART_MARGIN,
-            self.CHART_HEIGHT - self.CHART_MARGIN,
-            width=2,
+        # Axes, as two filled strips in the same image.
+        baseline = self.CHART_HEIGHT - self.CHART_MARGIN
+        image.put(
+            "#000000",
+            to=(self.CHART_MARGIN, baseline - 1, self.CHART_WIDTH - self.CHART_MARGIN, baseline + 1),
         )
-        self.chart_canvas.create_line(
-            self.CHART_MARGIN,
-            self.CHART_HEIGHT - self.CHART_MARGIN,
-            self.CHART_MARGIN,
-            self.CHART_MARGIN,
-            width=2,
+        image.put(
+            "#000000",
+            to=(self.CHART_MARGIN - 1, self.CHART_MARGIN, self.CHART_MARGIN + 1, baseline),
         )
 
     def _update_metrics_panel(self) -> None:
@@ -2,74 +2,159 @@
 
 from __future__ import annotations
 
+import json
 import math
-import random
+import os
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence, Tuple
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Tuple
 
-from .sensors import ENVIRONMENT_FEATURES, VOC_FEATURES
+import numpy as np
 
-FEATURE_COLUMNS = VOC_FEATURES + ENVIRONMENT_FEATURES
+# Numba is optional: when available, small fixed-size kernels beat NumPy by
+# avoiding per-call dispatch overhead. Everything falls back to NumPy.
+try:
+    from numba import get_num_threads, get_thread_id, njit, prange
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+from .dataset import ScentDataset, load_dataset
+from .sensors import ALL_FEATURES
+
+FEATURE_COLUMNS: Tuple[str, ...] = ALL_FEATURES
+_N_FEATURES = len(FEATURE_COLUMNS)
+
+# One C-level fetch of every feature value, in column order.
+_get_features = itemgetter(*FEATURE_COLUMNS)
 
 
 @dataclass
 class ModelArtifacts:
     """Container for the trained model and metadata."""
 
-    class_means: Dict[str, Dict[str, float]]
-    feature_columns: Iterable[str]
-    classes_: List[str]
+    centroids: np.ndarray
+    feature_columns: Tuple[str, ...]
+    classes_: np.ndarray
 
 
-def _compute_class_means(data: Sequence[Dict[str, float | str]]) -> Dict[str, Dict[str, float]]:
-    class_totals: Dict[str, Dict[str, float]] = {}
-    counts: Dict[str, int] = {}
-    for row in data:
-        label = str(row["scent_family"])
-        counts[label] = counts.get(label, 0) + 1
-        totals = class_totals.setdefault(
-            label, {feature: 0.0 for feature in FEATURE_COLUMNS}
-        )
-        for feature in FEATURE_COLUMNS:
-            totals[feature] += float(row[feature])
+def _compute_class_means(
+    X: np.ndarray, labels: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute per-class feature means as a single grouped reduction.
+
+    Returns the sorted class labels and a ``(n_classes, n_features)`` array of
+    centroids, summing each class with ``np.add.at`` instead of iterating over
+    rows and features in Python.
+    """
+
+    classes, inverse = np.unique(labels, return_inverse=True)
+
+    sums = np.zeros((classes.size, X.shape[1]), dtype=np.float64)
+    np.add.at(sums, inverse, X)
+    counts = np.bincount(inverse, minlength=classes.size)
+    means = sums / counts[:, None]
+    return classes, means
+
+
+if njit is not None:
+
+    # Declaring the full signature compiles the kernel at import time (and
+    # fixes contiguous float64 layouts) so the first prediction does not pay
+    # the JIT staging stall.
+    @njit("i8(f8[:, ::1], f8[::1], f8[::1])", cache=True, fastmath=True)
+    def _predict_kernel(
+        centroids: np.ndarray, sample: np.ndarray, out_probs: np.ndarray
+    ) -> int:  # pragma: no cover - exercised via _predict_from_means
+        """Fused distance + inverse-distance normalization over all classes."""
+
+        n_classes, n_features = centroids.shape
+        total = 0.0
+        for k in range(n_classes):
+            d2 = 0.0
+            for j in range(n_features):
+                diff = centroids[k, j] - sample[j]
+                d2 += diff * diff
+            score = 1.0 / (math.sqrt(d2) + 1e-6)
+            out_probs[k] = score
+            total += score
+
+        best = 0
+        for k in range(n_classes):
+            out_probs[k] /= total
+            if out_probs[k] > out_probs[best]:
+                best = k
+        return best
+
+    # No cache=True here: numba cannot cache parallel kernels that touch the
+    # threading layer (get_num_threads), and warns if asked to.
+    @njit(parallel=True, fastmath=True)
+    def _evaluate_kernel(
+        X: np.ndarray,
+        centroids: np.ndarray,
+        pred_map: np.ndarray,
+        true_idx: np.ndarray,
+        n_eval_classes: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:  # pragma: no cover - via train_model
+        """Tally per-class hits over test rows in parallel.
+
+        ``pred_map`` translates a centroid index into an index of the
+        evaluation label set, which may include test-only labels. Each thread
+        accumulates into its own row of the tally buffers to avoid contention;
+        rows are reduced after the loop.
+        """
 
-    class_means: Dict[str, Dict[str, float]] = {}
-    for label, totals in class_totals.items():
-        count = max(counts[label], 1)
-        class_means[label] = {
-            feature: totals[feature] / count for feature in FEATURE_COLUMNS
-        }
-    return class_means
+        n_threads = get_num_threads()
+        correct_local = np.zeros((n_threads, n_eval_classes), dtype=np.int64)
+        total_local = np.zeros((n_threads, n_eval_classes), dtype=np.int64)
+
+        for i in prange(X.shape[0]):
+            tid = get_thread_id()
+            best = 0
+            best_d2 = np.inf
+            for k in range(centroids.shape[0]):
+                d2 = 0.0
+                for j in range(X.shape[1]):
+                    diff = X[i, j] - centroids[k, j]
+                    d2 += diff * diff
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best = k
+            total_local[tid, true_idx[i]] += 1
+            if pred_map[best] == true_idx[i]:
+                correct_local[tid, true_idx[i]] += 1
+
+        return correct_local.sum(axis=0), total_local.sum(axis=0)
+
+else:
+    _predict_kernel = None
+    _evaluate_kernel = None
 
 
 def _predict_from_means(
-    class_means: Dict[str, Dict[str, float]], sample: Dict[str, float]
-) -> Tuple[str, Dict[str, float]]:
-    """Predict a scent family using distance to class means."""
-
-    distances: List[Tuple[str, float]] = []
-    for label, centroid in class_means.items():
-        distance = math.sqrt(
-            sum(
-                (float(sample[feature]) - centroid[feature]) ** 2
-                for feature in FEATURE_COLUMNS
-            )
+    centroids: np.ndarray, classes: np.ndarray, sample_vec: np.ndarray
+) -> Tuple[str, np.ndarray]:
+    """Predict a scent family using distance to class centroids."""
+
+    if _predict_kernel is not None:
+        probabilities = np.empty(centroids.shape[0], dtype=np.float64)
+        best = _predict_kernel(
+            np.ascontiguousarray(centroids), sample_vec, probabilities
         )
-        distances.append((label, distance))
+        return str(classes[best]), probabilities
+
+    distances = np.linalg.norm(centroids - sample_vec, axis=1)
 
     # Convert distances into normalized scores. Closer means higher probability.
-    scores: Dict[str, float] = {}
-    for label, distance in distances:
-        scores[label] = 1.0 / (distance + 1e-6)
-    total = sum(scores.values()) or 1.0
-    probabilities = {label: score / total for label, score in scores.items()}
+    scores = 1.0 / (distances + 1e-6)
+    probabilities = scores / scores.sum()
 
-    predicted_label = max(probabilities.items(), key=lambda item: item[1])[0]
+    predicted_label = str(classes[np.argmax(probabilities)])
     return predicted_label, probabilities
 
 
 def train_model(
-    data: Sequence[Dict[str, float | str]],
+    data: ScentDataset,
     *,
     test_size: float = 0.2,
     random_state: int = 42,
@@ -79,59 +164,86 @@ def train_model(
     if not 0 < test_size < 1:
         raise ValueError("test_size must be between 0 and 1")
 
-    dataset = [dict(row) for row in data]
-    if not dataset:
+    n_rows = len(data)
+    if not n_rows:
         raise ValueError("Dataset must contain rows to train the model.")
 
-    rng = random.Random(random_state)
-    rng.shuffle(dataset)
+    rng = np.random.default_rng(random_state)
 
-    if len(dataset) < 2:
-        train_data = dataset
-        test_data = dataset
+    if n_rows < 2:
+        X_train = X_test = data.X
+        y_train = y_test = data.y
     else:
-        holdout_count = max(1, int(round(len(dataset) * test_size)))
-        if holdout_count >= len(dataset):
-            holdout_count = len(dataset) - 1
-        test_data = dataset[:holdout_count]
-        train_data = dataset[holdout_count:]
-        if not train_data:
-            train_data = dataset
-
-    class_means = _compute_class_means(train_data)
+        # Stratified split: shuffle indices within each label group and take
+        # the holdout fraction per class, so every scent family keeps its
+        # share of both partitions.
+        test_parts = []
+        train_parts = []
+        for label in np.unique(data.y):
+            idx = np.flatnonzero(data.y == label)
+            rng.shuffle(idx)
+            holdout_count = int(round(idx.size * test_size))
+            test_parts.append(idx[:holdout_count])
+            train_parts.append(idx[holdout_count:])
+        test_idx = np.concatenate(test_parts)
+        train_idx = np.concatenate(train_parts)
+        if not test_idx.size:
+            test_idx, train_idx = train_idx[:1], train_idx[1:]
+        elif not train_idx.size:
+            train_idx, test_idx = test_idx[:1], test_idx[1:]
+        X_train, y_train = data.X[train_idx], data.y[train_idx]
+        X_test, y_test = data.X[test_idx], data.y[test_idx]
+
+    classes, centroids = _compute_class_means(X_train, y_train)
     artifacts = ModelArtifacts(
-        class_means=class_means,
+        centroids=centroids,
         feature_columns=FEATURE_COLUMNS,
-        classes_=sorted(class_means.keys()),
+        classes_=classes,
     )
 
-    evaluation: Dict[str, Dict[str, int]] = {
-        label: {"correct": 0, "total": 0} for label in artifacts.classes_
-    }
-    total_samples = len(test_data)
-    correct_predictions = 0
-
-    for row in test_data:
-        actual_label = str(row["scent_family"])
-        sample = {feature: float(row[feature]) for feature in FEATURE_COLUMNS}
-        predicted_label, _ = _predict_from_means(class_means, sample)
-        evaluation.setdefault(actual_label, {"correct": 0, "total": 0})
-        evaluation[actual_label]["total"] += 1
-        if predicted_label == actual_label:
-            evaluation[actual_label]["correct"] += 1
-            correct_predictions += 1
-
-    overall_accuracy = (
-        correct_predictions / total_samples if total_samples else 0.0
-    )
+    total_samples = len(y_test)
+
+    # The evaluation label set may include test-only labels the model never
+    # saw; pred_map translates centroid indices into evaluation indices.
+    eval_classes = np.union1d(classes, y_test)
+    true_idx = np.searchsorted(eval_classes, y_test)
+    pred_map = np.searchsorted(eval_classes, classes)
+
+    if _evaluate_kernel is not None:
+        correct_per_class, total_per_class = _evaluate_kernel(
+            np.ascontiguousarray(X_test),
+            np.ascontiguousarray(centroids),
+            pred_map,
+            true_idx,
+            eval_classes.size,
+        )
+        overall_accuracy = (
+            float(correct_per_class.sum()) / total_samples if total_samples else 0.0
+        )
+    else:
+        # Squared distances to every centroid via one matmul:
+        # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2 (the ||x||^2 term is
+        # constant per row but kept so D2 stays a true distance matrix).
+        G = X_test @ centroids.T
+        D2 = (
+            (X_test**2).sum(axis=1, keepdims=True)
+            - 2.0 * G
+            + (centroids**2).sum(axis=1)
+        )
+        correct_mask = pred_map[D2.argmin(axis=1)] == true_idx
+        total_per_class = np.bincount(true_idx, minlength=eval_classes.size)
+        correct_per_class = np.bincount(
+            true_idx[correct_mask], minlength=eval_classes.size
+        )
+        overall_accuracy = float(correct_mask.mean()) if total_samples else 0.0
 
     per_class_accuracy = {
-        label: (
-            evaluation[label]["correct"] / evaluation[label]["total"]
-            if evaluation[label]["total"]
+        str(label): (
+            float(correct_per_class[idx]) / float(total_per_class[idx])
+            if total_per_class[idx]
             else None
         )
-        for label in sorted(evaluation.keys())
+        for idx, label in enumerate(eval_classes)
     }
 
     metrics: Dict[str, object] = {
@@ -143,12 +255,103 @@ def train_model(
     return artifacts, metrics
 
 
+def _dataset_signature(path: Path) -> str:
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def train_model_cached(
+    dataset_path: Path,
+    *,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    cache_path: Path | None = None,
+) -> Tuple[ModelArtifacts, Dict[str, object]]:
+    """Train with an on-disk artifact cache keyed by dataset and parameters.
+
+    When the dataset file is unchanged since the cache was written and the
+    split parameters match, loading the small ``.npz`` replaces retraining
+    entirely; any miss (no cache, stale signature, different parameters,
+    unreadable file) falls back to a fresh ``train_model``.
+    """
+
+    signature = (
+        f"{_dataset_signature(dataset_path)}-{test_size}-{random_state}"
+    )
+    if cache_path is None:
+        cache_path = dataset_path.with_suffix(".model.npz")
+
+    if cache_path.exists():
+        try:
+            with np.load(cache_path) as cached:
+                if str(cached["dataset_sig"]) == signature:
+                    artifacts = ModelArtifacts(
+                        centroids=cached["centroids"],
+                        feature_columns=FEATURE_COLUMNS,
+                        classes_=cached["classes"],
+                    )
+                    metrics = json.loads(str(cached["metrics"]))
+                    return artifacts, metrics
+        except (OSError, KeyError, ValueError):
+            pass
+
+    artifacts, metrics = train_model(
+        load_dataset(dataset_path), test_size=test_size, random_state=random_state
+    )
+    np.savez(
+        cache_path,
+        centroids=artifacts.centroids,
+        classes=artifacts.classes_,
+        dataset_sig=np.array(signature),
+        metrics=np.array(json.dumps(metrics)),
+    )
+    return artifacts, metrics
+
+
 def predict(
     artifacts: ModelArtifacts, sample: Dict[str, float]
 ) -> Tuple[str, Dict[str, float]]:
     """Predict the scent family for a single reading."""
 
-    filtered_sample = {
-        feature: float(sample[feature]) for feature in artifacts.feature_columns
+    sample_vec = np.fromiter(
+        _get_features(sample), dtype=np.float64, count=_N_FEATURES
+    )
+    predicted_label, probabilities = _predict_from_means(
+        artifacts.centroids, artifacts.classes_, sample_vec
+    )
+    probability_map = {
+        str(label): float(prob)
+        for label, prob in zip(artifacts.classes_, probabilities)
     }
-    return _predict_from_means(artifacts.class_means, filtered_sample)
+    return predicted_label, probability_map
+
+
+def predict_batch(
+    artifacts: ModelArtifacts, X: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Predict scent families for a whole ``(n_samples, n_features)`` batch.
+
+    One matmul-based distance pass covers every row, so callers that already
+    hold a vectorized capture block (the streaming endpoint, offline
+    evaluation) skip the per-sample Python dispatch in :func:`predict`.
+
+    Returns ``(labels, probabilities)``: the predicted label per row plus the
+    full ``(n_samples, n_classes)`` probability matrix in ``classes_`` order.
+    """
+
+    X = np.asarray(X, dtype=np.float64)
+    centroids = artifacts.centroids
+
+    # Same expansion as the evaluation path: ||x - c||^2 via one matmul,
+    # clamped at zero before the sqrt to absorb rounding.
+    D2 = (
+        (X**2).sum(axis=1, keepdims=True)
+        - 2.0 * (X @ centroids.T)
+        + (centroids**2).sum(axis=1)
+    )
+    distances = np.sqrt(np.maximum(D2, 0.0))
+
+    scores = 1.0 / (distances + 1e-6)
+    probabilities = scores / scores.sum(axis=1, keepdims=True)
+    labels = artifacts.classes_[probabilities.argmax(axis=1)]
+    return labels, probabilities
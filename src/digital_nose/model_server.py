@@ -0,0 +1,122 @@
+"""Share one trained model across processes via POSIX shared memory.
+
+A deployment with several worker processes (for example multiple web
+workers) would otherwise retrain the same centroid model in each process.
+``publish_artifacts`` trains once and copies the centroid table plus class
+labels into a named ``multiprocessing.shared_memory`` block; workers attach
+with ``attach_artifacts`` and get zero-copy NumPy views over the same
+memory.
+"""
+
+from __future__ import annotations
+
+import signal
+from multiprocessing import shared_memory
+from typing import Tuple
+
+import numpy as np
+
+from .dataset import ensure_dataset
+from .model import FEATURE_COLUMNS, ModelArtifacts, train_model_cached
+
+SHARED_MODEL_NAME = "scent_centroids"
+
+# Layout of the shared block: one header record, then the float64 centroid
+# matrix, then the fixed-width unicode class labels.
+_HEADER_DTYPE = np.dtype(
+    [
+        ("n_classes", np.int64),
+        ("n_features", np.int64),
+        ("label_itemsize", np.int64),
+    ]
+)
+
+
+def publish_artifacts(
+    artifacts: ModelArtifacts, *, name: str = SHARED_MODEL_NAME
+) -> shared_memory.SharedMemory:
+    """Copy trained artifacts into a named shared-memory block.
+
+    The caller owns the returned handle and must keep it alive (and
+    eventually ``unlink()`` it) for as long as workers may attach.
+    """
+
+    centroids = np.ascontiguousarray(artifacts.centroids, dtype=np.float64)
+    classes = np.ascontiguousarray(artifacts.classes_)
+
+    size = _HEADER_DTYPE.itemsize + centroids.nbytes + classes.nbytes
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+    header = np.ndarray(1, dtype=_HEADER_DTYPE, buffer=shm.buf)
+    header[0] = (centroids.shape[0], centroids.shape[1], classes.dtype.itemsize)
+
+    offset = _HEADER_DTYPE.itemsize
+    shared_centroids = np.ndarray(
+        centroids.shape, dtype=np.float64, buffer=shm.buf, offset=offset
+    )
+    shared_centroids[:] = centroids
+
+    offset += centroids.nbytes
+    shared_classes = np.ndarray(
+        classes.shape, dtype=classes.dtype, buffer=shm.buf, offset=offset
+    )
+    shared_classes[:] = classes
+    return shm
+
+
+def attach_artifacts(
+    *, name: str = SHARED_MODEL_NAME
+) -> Tuple[ModelArtifacts, shared_memory.SharedMemory]:
+    """Map a published model read-only, without copying or retraining.
+
+    Returns the artifacts plus the shared-memory handle; the arrays stay
+    valid only while the handle is open, so keep it for the worker's
+    lifetime.
+    """
+
+    shm = shared_memory.SharedMemory(name=name)
+    n_classes, n_features, label_itemsize = np.ndarray(
+        1, dtype=_HEADER_DTYPE, buffer=shm.buf
+    )[0]
+
+    offset = _HEADER_DTYPE.itemsize
+    centroids = np.ndarray(
+        (n_classes, n_features), dtype=np.float64, buffer=shm.buf, offset=offset
+    )
+    offset += centroids.nbytes
+    classes = np.ndarray(
+        (n_classes,),
+        dtype=f"<U{label_itemsize // 4}",
+        buffer=shm.buf,
+        offset=offset,
+    )
+
+    artifacts = ModelArtifacts(
+        centroids=centroids,
+        feature_columns=FEATURE_COLUMNS,
+        classes_=classes,
+    )
+    return artifacts, shm
+
+
+def main() -> None:
+    """Train once and keep the model published until interrupted."""
+
+    dataset_path = ensure_dataset()
+    artifacts, metrics = train_model_cached(dataset_path)
+    shm = publish_artifacts(artifacts)
+    print(f"Model published at shared memory block '{shm.name}'.")
+    print(f"Overall accuracy: {metrics.get('overall_accuracy', 0.0):.2%}")
+    print("Press Ctrl+C to stop.")
+    try:
+        signal.pause()
+    except (KeyboardInterrupt, AttributeError):
+        # signal.pause() is unavailable on Windows; fall through to cleanup.
+        pass
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Iterable
 
+import numpy as np
+
 
 @dataclass
 class ScentReport:
@@ -21,17 +23,33 @@ class ScentReport:
     def as_dict(self) -> Dict[str, object]:
         """Return a serializable representation of the report."""
 
+        # Round each mapping in one vectorized pass rather than a Python
+        # round() call per entry.
+        probabilities = np.round(
+            np.fromiter(
+                self.raw_probabilities.values(),
+                dtype=np.float64,
+                count=len(self.raw_probabilities),
+            ),
+            4,
+        )
+        environment = np.round(
+            np.fromiter(
+                self.environment.values(),
+                dtype=np.float64,
+                count=len(self.environment),
+            ),
+            2,
+        )
         return {
             "timestamp": self.timestamp.isoformat(),
             "predicted_family": self.predicted_family,
             "confidence": round(self.confidence, 4),
             "intensity_index": round(self.intensity_index, 2),
-            "raw_probabilities": {
-                label: round(prob, 4) for label, prob in self.raw_probabilities.items()
-            },
-            "environment": {
-                key: round(value, 2) for key, value in self.environment.items()
-            },
+            "raw_probabilities": dict(
+                zip(self.raw_probabilities, probabilities.tolist())
+            ),
+            "environment": dict(zip(self.environment, environment.tolist())),
         }
 
     @classmethod
@@ -56,10 +74,14 @@ class ScentReport:
         )
 
 
-def intensity_from_reading(total_voc: float) -> float:
-    """Compute a simple intensity score from total VOCs."""
+def intensity_from_reading(total_voc: float | np.ndarray) -> float | np.ndarray:
+    """Compute a simple intensity score from total VOCs.
+
+    Accepts a scalar or an array of totals; single-sample callers go through
+    ``ScentReport.from_prediction``, which coerces the result back to float.
+    """
 
     # Normalize by an arbitrary reference range to produce a 0-100 index.
     reference_max = 600.0
-    scaled = total_voc / reference_max * 100
-    return float(max(0.0, min(100.0, scaled)))
+    scaled = total_voc * (100.0 / reference_max)
+    return np.clip(scaled, 0.0, 100.0)
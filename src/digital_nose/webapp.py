@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
 
-from .dataset import load_dataset
-from .model import predict, train_model
+# orjson is optional: its C serializer is several times faster than stdlib
+# json on float-heavy prediction payloads. jsonify remains the fallback.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from .dataset import ensure_dataset
+from .model import predict, predict_batch, train_model_cached
 from .report import ScentReport, intensity_from_reading
 from .sensors import (
     ENVIRONMENT_FEATURES,
@@ -24,19 +33,63 @@ app = Flask(__name__)
 
 # Global state
 simulator = SensorSimulator()
-dataset: list[Dict[str, Any]] = []
 artifacts: Any = None
 metrics: Dict[str, Any] = {}
 profile_map: Dict[str, ScentProfile] = {
     profile.name: profile for profile in DEFAULT_PROFILES
 }
+_init_lock = threading.Lock()
+_init_payload: str = ""
+_init_etag: str = ""
 
 
 def initialize_model() -> None:
-    """Load dataset and train the model."""
-    global dataset, artifacts, metrics
-    dataset = load_dataset()
-    artifacts, metrics = train_model(dataset)
+    """Load or train the model once, even under concurrent requests.
+
+    Double-checked locking: the threaded dev server can land several cold
+    first requests at once, and without the lock each would pay the full
+    cold-start cost (and race on the module globals). The artifact cache
+    keyed by the dataset signature turns warm server starts into a small
+    ``.npz`` load instead of a full retrain.
+    """
+    global artifacts, metrics, _init_payload, _init_etag
+    if artifacts is not None:
+        return
+    with _init_lock:
+        if artifacts is not None:
+            return
+        trained, trained_metrics = train_model_cached(ensure_dataset())
+
+        # Everything /api/init serves is static once training finished, so
+        # serialize (and tag) the payload exactly once.
+        payload = json.dumps({
+            "profiles": list(profile_map.keys()),
+            "voc_features": VOC_FEATURES,
+            "environment_features": ENVIRONMENT_FEATURES,
+            "metrics": {
+                "overall_accuracy": trained_metrics.get("overall_accuracy", 0.0),
+                "per_class_accuracy": trained_metrics.get(
+                    "per_class_accuracy", {}
+                ),
+            },
+            "classes": list(trained.classes_),
+        })
+        _init_payload = payload
+        _init_etag = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        metrics = trained_metrics
+        # Publish `artifacts` last: the unlocked fast path keys on it, so
+        # everything it guards must already be visible by the time it is set.
+        artifacts = trained
+
+
+def _json(obj: Any) -> Response:
+    """Build a JSON response via orjson when available."""
+    if orjson is not None:
+        return Response(
+            orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype="application/json",
+        )
+    return jsonify(obj)
 
 
 # Routes
@@ -48,20 +101,14 @@ def index() -> str:
 
 @app.route("/api/init", methods=["GET"])
 def api_init() -> Any:
-    """Initialize the application and return configuration."""
-    if artifacts is None:
-        initialize_model()
-
-    return jsonify({
-        "profiles": list(profile_map.keys()),
-        "voc_features": VOC_FEATURES,
-        "environment_features": ENVIRONMENT_FEATURES,
-        "metrics": {
-            "overall_accuracy": metrics.get("overall_accuracy", 0.0),
-            "per_class_accuracy": metrics.get("per_class_accuracy", {}),
-        },
-        "classes": artifacts.classes_ if artifacts else [],
-    })
+    """Initialize the application and return the cached configuration."""
+    initialize_model()
+
+    return Response(
+        _init_payload,
+        mimetype="application/json",
+        headers={"Cache-Control": "public, max-age=60", "ETag": _init_etag},
+    )
 
 
 @app.route("/api/capture", methods=["POST"])
@@ -71,13 +118,18 @@ def api_capture() -> Any:
     profile_name = data.get("profile")
 
     if profile_name not in profile_map:
-        return jsonify({"error": "Unknown profile"}), 400
+        return _json({"error": "Unknown profile"}), 400
+
+    initialize_model()
 
     profile = profile_map[profile_name]
-    reading = simulator.capture(profile, n_samples=1)[0]
+    # The vector form avoids re-walking the reading dict on the per-request
+    # hot path: VOC total and environment fields are one slice each.
+    reading_vec, reading = simulator.capture_vector(profile)
+    n_voc = len(VOC_FEATURES)
 
-    total_voc = sum(reading[feature] for feature in VOC_FEATURES)
-    environment = {feature: reading[feature] for feature in ENVIRONMENT_FEATURES}
+    total_voc = float(reading_vec[:n_voc].sum())
+    environment = dict(zip(ENVIRONMENT_FEATURES, reading_vec[n_voc:].tolist()))
 
     predicted_family, probabilities = predict(artifacts, reading)
     report = ScentReport.from_prediction(
@@ -88,9 +140,9 @@ def api_capture() -> Any:
     )
 
     # Prepare response
-    return jsonify({
+    return _json({
         "success": True,
-        "reading": {feature: reading[feature] for feature in VOC_FEATURES},
+        "reading": dict(zip(VOC_FEATURES, reading_vec[:n_voc].tolist())),
         "report": {
             "predicted_family": report.predicted_family,
             "confidence": report.confidence,
@@ -102,6 +154,59 @@ def api_capture() -> Any:
     })
 
 
+@app.route("/api/capture_stream", methods=["POST"])
+def api_capture_stream() -> Any:
+    """Stream a batch of captures as newline-delimited JSON.
+
+    One HTTP round trip covers the whole batch: the simulator produces all
+    samples in a single vectorized call and the response body is NDJSON, so
+    dashboards polling for continuous capture pay Flask routing once per
+    batch instead of once per sample.
+    """
+    data = request.get_json(silent=True) or {}
+    profile_name = data.get("profile")
+
+    if profile_name not in profile_map:
+        return _json({"error": "Unknown profile"}), 400
+
+    try:
+        n_samples = int(request.args.get("n", data.get("n", 25)))
+    except (TypeError, ValueError):
+        return _json({"error": "n must be an integer"}), 400
+    if not 1 <= n_samples <= 10_000:
+        return _json({"error": "n must be between 1 and 10000"}), 400
+
+    initialize_model()
+
+    profile = profile_map[profile_name]
+    block = simulator._capture_block(profile, n_samples)
+    n_voc = len(VOC_FEATURES)
+
+    # One batched prediction and intensity pass for the whole block; the
+    # generator below only slices and serializes.
+    labels, probabilities = predict_batch(artifacts, block)
+    confidences = probabilities.max(axis=1)
+    intensities = intensity_from_reading(block[:, :n_voc].sum(axis=1))
+
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj).encode()  # noqa: E731
+
+    def generate():
+        for index, row in enumerate(block):
+            values = row.tolist()
+            yield dumps({
+                "reading": dict(zip(VOC_FEATURES, values[:n_voc])),
+                "environment": dict(zip(ENVIRONMENT_FEATURES, values[n_voc:])),
+                "predicted_family": str(labels[index]),
+                "confidence": float(confidences[index]),
+                "intensity_index": float(intensities[index]),
+            }) + b"\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
 def main(host: str = "127.0.0.1", port: int = 5000, debug: bool = False) -> None:
     """Start the Flask development server."""
     print(f"Starting Digital Nose Web UI...")